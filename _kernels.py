@@ -0,0 +1,68 @@
+"""Numba-compiled kernels for the convolution viewers.
+
+Importing this module requires numba; callers guard the import and fall
+back to their vectorized NumPy paths when it is unavailable.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def conv_full(x, h, out):
+    """Direct full convolution of x and h written into out.
+
+    out must have x.size + h.size - 1 elements; writing into a
+    caller-owned buffer lets repeated calls skip the allocation as well
+    as NumPy's per-call dispatch overhead.
+    """
+    for i in range(out.size):
+        total = 0.0
+        lo = max(0, i - h.size + 1)
+        hi = min(i + 1, x.size)
+        for j in range(lo, hi):
+            total += x[j] * h[i - j]
+        out[i] = total
+
+
+@njit(cache=True)
+def signal_stats(a):
+    """Single-pass (min, max, sum, energy, nonzero count) of a signal.
+
+    Replaces five separate NumPy reductions - and their per-call dispatch
+    overhead - with one L1-resident loop.
+    """
+    amin = a[0]
+    amax = a[0]
+    total = 0.0
+    energy = 0.0
+    nonzero = 0
+    for v in a:
+        if v < amin:
+            amin = v
+        if v > amax:
+            amax = v
+        total += v
+        energy += v * v
+        if v != 0.0:
+            nonzero += 1
+    return amin, amax, total, energy, nonzero
+
+
+@njit(cache=True, fastmath=True)
+def conv_step(x, h, n):
+    """Return (lo, product, y_n) for output sample n.
+
+    product[i] = x[lo + i] * h[n - lo - i] over the valid overlap window
+    k in [lo, hi], and y_n is the sum of the products, computed in a
+    single pass.
+    """
+    lo = max(0, n - h.size + 1)
+    hi = min(x.size - 1, n)
+    product = np.empty(hi - lo + 1)
+    total = 0.0
+    for i in range(product.size):
+        k = lo + i
+        value = x[k] * h[n - k]
+        product[i] = value
+        total += value
+    return lo, product, total
@@ -1,13 +1,50 @@
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import matplotlib
 matplotlib.use('TkAgg')
 
+try:
+    from scipy.signal import oaconvolve
+except ImportError:  # scipy is optional; fall back to direct convolution
+    oaconvolve = None
+
+try:
+    import cupy as cp
+except ImportError:  # cupy is optional; CPU paths below cover everything
+    cp = None
+
+# Above this many multiply-adds the FFT overlap-add method beats direct
+# convolution; below it np.convolve's C loop wins
+_FFT_CONV_THRESHOLD = 4096
+
+# Above this many multiply-adds the host<->device transfer cost is
+# amortized and the GPU convolution wins over the CPU FFT path
+_GPU_CONV_THRESHOLD = 1_000_000
+
+
+def _full_convolve(x, h):
+    """Full convolution of x and h, FFT- or GPU-based when signals are long"""
+    if cp is not None and x.size * h.size > _GPU_CONV_THRESHOLD:
+        return cp.asnumpy(cp.convolve(cp.asarray(x), cp.asarray(h)))
+    if oaconvolve is not None and x.size * h.size > _FFT_CONV_THRESHOLD:
+        return oaconvolve(x, h)
+    return np.convolve(x, h)
+
+
 class StepByStepConvolutionViewer:
+    # Constant format strings for the per-frame widget texts; %-formatting
+    # of small templates is cheaper than rebuilding f-strings each frame
+    _MATH_FMT = "y[%d] = Σ x[k] × h[%d-k] = %.3f"
+    _STEP_FMT = "Step %d/%d: Computing y[%d]"
+    _STATUS_FMT = "Computing y[%d] = %.3f"
+
     def __init__(self, root, x_signal=None, h_signal=None):
         self.root = root
         self.root.title("🎬 Step-by-Step Convolution Animation")
@@ -18,22 +55,62 @@ class StepByStepConvolutionViewer:
         # Configure styling
         self.setup_styles()
         
-        # Initialize signals
+        # Initialize signals; float32 is plenty for on-screen precision and
+        # halves the footprint of the per-step vectorized work
         if x_signal is None:
-            self.x_signal = np.array([1, 2, 1])
+            self.x_signal = np.array([1, 2, 1], dtype=np.float32)
         else:
             self.x_signal = self._clean_signal(x_signal)
-            
+
         if h_signal is None:
-            self.h_signal = np.array([0.5, 0.3, 0.2])
+            self.h_signal = np.array([0.5, 0.3, 0.2], dtype=np.float32)
         else:
             self.h_signal = self._clean_signal(h_signal)
         
         # Animation state
         self.output_length = len(self.x_signal) + len(self.h_signal) - 1
+        # Full convolution computed once up front; each step only reveals a prefix
+        self._y_full = _full_convolve(self.x_signal, self.h_signal).astype(np.float32)
+        # Global extrema for the fixed axis limits, computed once: the
+        # product panel is bounded by the pairwise products of x and h,
+        # the output panel by the full convolution
+        pairwise = np.outer(self.x_signal, self.h_signal)
+        self._x_max = float(np.max(self.x_signal))
+        self._h_max = float(np.max(self.h_signal))
+        self._prod_min = float(np.min(pairwise))
+        self._prod_max = float(np.max(pairwise))
+        self._y_max = float(np.max(np.abs(self._y_full)))
+        # Valid overlap k in [lo, hi] for each step n is a pure function of
+        # the signal lengths; tabulate it once
+        steps = np.arange(self.output_length)
+        self._overlap_lo = np.maximum(0, steps - len(self.h_signal) + 1)
+        self._overlap_hi = np.minimum(len(self.x_signal) - 1, steps)
+        # Step-invariant ranges and a reusable scratch buffer for h[n-k];
+        # rebuilding them per frame only churns the allocator
+        self._k_range = np.arange(-len(self.h_signal),
+                                  len(self.x_signal) + len(self.h_signal))
+        self._h_shifted_buf = np.zeros(len(self._k_range))
+        # Optional Numba kernel for the per-step product; the compile cost
+        # is paid once here instead of on the first animation step
+        try:
+            from _kernels import conv_step
+            self._conv_step = conv_step
+            self._conv_step(self.x_signal, self.h_signal, 0)
+        except ImportError:
+            self._conv_step = None
         self.current_n = 0
         self.is_playing = False
         self.animation = None
+        self._speed_after = None
+
+        # Blitting state: static background captured after the first full draw
+        self._background = None
+        self._exporting = False
+
+        # Redraw bookkeeping: skip update_plots when the step is unchanged
+        self._last_drawn_n = -1
+        self._force_redraw = True
+        self._last_text_state = None
         
         # Status variables
         self.status_var = tk.StringVar(value="Ready to animate convolution")
@@ -45,10 +122,10 @@ class StepByStepConvolutionViewer:
         
     def _clean_signal(self, signal):
         """Remove trailing zeros from signal"""
-        if np.any(signal != 0):
-            last_nonzero = np.where(signal != 0)[0][-1]
-            return signal[:last_nonzero + 1]
-        return signal[:3]  # Minimum length
+        nonzero = np.flatnonzero(signal)
+        if nonzero.size:
+            return signal[:nonzero[-1] + 1].astype(np.float32, copy=False)
+        return signal[:3].astype(np.float32, copy=False)  # Minimum length
         
     def setup_styles(self):
         """Configure clean, modern UI styles"""
@@ -293,15 +370,7 @@ class StepByStepConvolutionViewer:
             ax.spines['left'].set_color('#2563eb')
             ax.spines['bottom'].set_color('#2563eb')
             ax.tick_params(colors='#64748b', labelsize=9)
-        
-    def update_plots(self):
-        """Update all plots for current step"""
-        # Clear all axes
-        self.ax_x.clear()
-        self.ax_h.clear()
-        self.ax_product.clear()
-        self.ax_output.clear()
-        
+
         # Color scheme
         colors = {
             'x_signal': '#3b82f6',
@@ -310,124 +379,247 @@ class StepByStepConvolutionViewer:
             'output': '#1e293b',
             'highlight': '#dc2626'
         }
-        
-        # Current step
-        n = self.current_n
-        
-        # 1. Plot x[n] - Input Signal
+
+        self._draw_static_panels(colors)
+
+        # Animated artists: created once, data mutated per step, drawn via
+        # blitting on top of the cached static background
+        self.h_markers, self.h_stems = self._add_stem_artists(
+            self.ax_h, colors['h_signal'], 's')
+        self.product_markers, self.product_stems = self._add_stem_artists(
+            self.ax_product, colors['product'], 'D')
+        self.output_markers, self.output_stems = self._add_stem_artists(
+            self.ax_output, colors['output'], 'o')
+        self.output_highlight, self.output_highlight_stem = self._add_stem_artists(
+            self.ax_output, colors['highlight'], 'o')
+
+        # One translucent span marks the not-yet-computed tail of the output
+        self.output_pending = self.ax_output.axvspan(0, 0, color='lightgray',
+                                                     alpha=0.15, animated=True)
+
+        # Per-step titles live outside ax.bbox, so the whole figure bbox is
+        # blitted rather than per-axes regions
+        self.title_h = self.ax_h.set_title('', fontsize=11, fontweight='bold',
+                                           animated=True)
+        self.title_product = self.ax_product.set_title('', fontsize=11,
+                                                       fontweight='bold',
+                                                       animated=True)
+        self.title_output = self.ax_output.set_title('', fontsize=11,
+                                                     fontweight='bold',
+                                                     animated=True)
+
+        self._animated_artists = [
+            self.h_stems, self.h_markers,
+            self.product_stems, self.product_markers,
+            self.output_pending,
+            self.output_stems, self.output_markers,
+            self.output_highlight_stem, self.output_highlight,
+            self.title_h, self.title_product, self.title_output,
+        ]
+
+        self._background = None
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _draw_static_panels(self, colors):
+        """Draw everything that is constant across animation steps.
+
+        Called once from setup_plots; call again (after invalidating the
+        blit background) if the signals are ever replaced.
+        """
+        # 1. Static panel: x[k] never changes between steps, draw it once
         k_x = np.arange(len(self.x_signal))
-        self.ax_x.stem(k_x, self.x_signal, basefmt=' ', 
+        self.ax_x.stem(k_x, self.x_signal, basefmt=' ',
                       linefmt=colors['x_signal'], markerfmt='o' )
         self.ax_x.set_title('Input Signal x[k]', fontsize=11, fontweight='bold')
         self.ax_x.set_ylabel('Amplitude')
         self.ax_x.grid(True, linestyle='--' )
-        self.ax_x.set_ylim([-0.5, max(2, np.max(self.x_signal) + 0.5)])
-        
-        # 2. Plot h[n-k] - Flipped and Shifted Impulse Response
-        h_flipped = np.flip(self.h_signal)
-        # Create extended range to show the shifted signal
-        k_range = np.arange(-len(self.h_signal), len(self.x_signal) + len(self.h_signal))
-        h_shifted = np.zeros(len(k_range))
-        
-        # Position the flipped h signal at position n
-        start_idx = n + len(self.h_signal) - 1
-        if start_idx >= 0 and start_idx < len(k_range):
-            for i, val in enumerate(h_flipped):
-                idx = start_idx - i
-                if 0 <= idx < len(k_range):
-                    h_shifted[idx] = val
-        
-        # Plot h[n-k]
-        valid_indices = h_shifted != 0
-        if np.any(valid_indices):
-            self.ax_h.stem(k_range[valid_indices], h_shifted[valid_indices], 
-                          basefmt=' ', linefmt=colors['h_signal'], markerfmt='s' )
-        
-        self.ax_h.set_title(f'h[{n}-k] (Flipped & Shifted)', fontsize=11, fontweight='bold')
+        self.ax_x.set_ylim([-0.5, max(2, self._x_max + 0.5)])
+
+        # Static styling, labels and limits for the animated panels. Limits
+        # must be fixed up front so the blitted background stays valid; the
+        # extrema were precomputed once in __init__.
         self.ax_h.set_ylabel('Amplitude')
         self.ax_h.grid(True, linestyle='--' )
         self.ax_h.set_xlim([-1, max(len(self.x_signal), len(self.h_signal)) + 1])
-        self.ax_h.set_ylim([-0.5, max(2, np.max(self.h_signal) + 0.5)])
-        
-        # 3. Plot Product x[k] * h[n-k]
-        product = np.zeros(len(self.x_signal))
-        sum_value = 0
-        
-        for k in range(len(self.x_signal)):
-            h_idx = n - k
-            if 0 <= h_idx < len(self.h_signal):
-                product[k] = self.x_signal[k] * self.h_signal[h_idx]
-                sum_value += product[k]
-        
-        # Plot non-zero products
-        non_zero_k = product != 0
-        if np.any(non_zero_k):
-            self.ax_product.stem(k_x[non_zero_k], product[non_zero_k], 
-                               basefmt=' ', linefmt=colors['product'], markerfmt='D' )
-        
+        self.ax_h.set_ylim([-0.5, max(2, self._h_max + 0.5)])
+
         self.ax_product.axhline(y=0, color='gray', linestyle='-' )
-        self.ax_product.set_title(f'x[k] × h[{n}-k] → Sum = {sum_value:.3f}', 
-                                 fontsize=11, fontweight='bold')
         self.ax_product.set_ylabel('Product')
         self.ax_product.grid(True, linestyle='--' )
-        self.ax_product.set_ylim([min(-0.5, np.min(product) - 0.2), 
-                                 max(2, np.max(product) + 0.2)])
-        
-        # 4. Plot Output y[n] - Convolution Result
-        y_computed = np.zeros(self.output_length)
-        for i in range(min(n + 1, self.output_length)):
-            for k in range(len(self.x_signal)):
-                h_idx = i - k
-                if 0 <= h_idx < len(self.h_signal):
-                    y_computed[i] += self.x_signal[k] * self.h_signal[h_idx]
-        
-        # Plot computed output up to current step
-        n_computed = np.arange(n + 1)
-        if len(n_computed) > 0:
-            self.ax_output.stem(n_computed, y_computed[:n + 1], 
-                              basefmt=' ', linefmt=colors['output'], markerfmt='o' )
-            
-            # Highlight current output sample
-            if n < len(y_computed):
-                self.ax_output.stem([n], [y_computed[n]], 
-                                  basefmt=' ', linefmt=colors['highlight'], 
-                                  markerfmt='o')
-        
-        # Plot remaining samples as faded
-        if n + 1 < self.output_length:
-            remaining_n = np.arange(n + 1, self.output_length)
-            remaining_y = np.zeros(len(remaining_n))
-            self.ax_output.stem(remaining_n, remaining_y, 
-                              basefmt=' ', linefmt='lightgray', markerfmt='o'
-                              )
-        
-        self.ax_output.set_title(f'Convolution Output y[n] | Step {n + 1}/{self.output_length}', 
-                               fontsize=11, fontweight='bold')
+        self.ax_product.set_xlim([-1, len(self.x_signal)])
+        self.ax_product.set_ylim([min(-0.5, self._prod_min - 0.2),
+                                 max(2, self._prod_max + 0.2)])
+
         self.ax_output.set_xlabel('Sample Index (n)')
         self.ax_output.set_ylabel('Amplitude')
         self.ax_output.grid(True, linestyle='--' )
-        
         if self.output_length > 0:
             self.ax_output.set_xlim([-0.5, self.output_length - 0.5])
-            y_max = max(2, np.max(np.abs(y_computed)) + 0.5) if np.any(y_computed) else 2
+            y_max = max(2, self._y_max + 0.5)
             self.ax_output.set_ylim([-y_max/2, y_max])
-        
-        # Update equation
-        self.math_var.set(f"y[{n}] = Σ x[k] × h[{n}-k] = {sum_value:.3f}")
-        
-        # Update step info
-        self.step_label.config(text=f"Step {n + 1}/{self.output_length}: Computing y[{n}]")
-        
-        # Update progress
+
+    @staticmethod
+    def _add_stem_artists(ax, color, marker):
+        """Create a reusable marker Line2D plus stem LineCollection on ax"""
+        markers, = ax.plot([], [], marker, color=color, animated=True)
+        stems = LineCollection([], colors=color, animated=True)
+        ax.add_collection(stems)
+        return markers, stems
+
+    def _on_resize(self, event):
+        """Invalidate the cached background when the canvas is resized"""
+        self._background = None
+        self._force_redraw = True
+
+    def _on_draw(self, event):
+        """Recapture the static layer after any full draw.
+
+        Full draws skip animated artists, and the backend triggers them on
+        its own (initial window mapping, Tk resizes), so paint the artists
+        back on top of the fresh background here. During export the
+        artists are temporarily un-animated and already part of the draw.
+        """
+        if self._exporting:
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists:
+            self.fig.draw_artist(artist)
+
+    def _draw_frame(self):
+        """Render the animated artists on top of the cached static layer"""
+        if self._exporting:
+            # Export goes through matplotlib's full-draw pipeline
+            self.canvas.draw()
+            return
+        if self._background is None:
+            # The full draw fires draw_event, so _on_draw recaptures the
+            # background and paints the artists before the backend blits
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self._animated_artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+    @staticmethod
+    def _stem_segments(k, values):
+        """Vertical stem segments from the baseline to each sample.
+
+        Returns an (N, 2, 2) array so LineCollection.set_segments gets one
+        batch assignment instead of a per-segment Python list.
+        """
+        k = np.asarray(k, dtype=float)
+        values = np.asarray(values, dtype=float)
+        return np.stack([np.column_stack([k, np.zeros_like(values)]),
+                         np.column_stack([k, values])], axis=1)
+
+    def _compute_step(self, n):
+        """Compute the arrays behind the animated artists for step n.
+
+        Every returned array is freshly indexed, so the results can be
+        cached (the export path tabulates all steps up front).
+        """
+        # h[n-k]: place h_signal as one contiguous block ending at start_idx
+        # (writing the flipped copy at decreasing indices is equivalent)
+        h_shifted = self._h_shifted_buf
+        h_shifted.fill(0)
+        start_idx = n + len(self.h_signal) - 1
+        base = start_idx - len(self.h_signal) + 1
+        lo = max(0, base)
+        hi = min(len(self._k_range), start_idx + 1)
+        if lo < hi:
+            h_shifted[lo:hi] = self.h_signal[lo - base:hi - base]
+        valid_indices = h_shifted != 0
+
+        # Product x[k] * h[n-k] over the tabulated overlap window
+        if self._conv_step is not None:
+            olo, product, sum_value = self._conv_step(self.x_signal,
+                                                      self.h_signal, n)
+            kk = np.arange(olo, olo + product.size)
+        else:
+            olo, ohi = self._overlap_lo[n], self._overlap_hi[n]
+            kk = np.arange(olo, ohi + 1)
+            product = self.x_signal[kk] * self.h_signal[n - kk]
+            sum_value = self._y_full[n]
+
+        return {
+            'h_k': self._k_range[valid_indices],
+            'h_values': h_shifted[valid_indices],
+            'kk': kk,
+            'product': product,
+            'sum': sum_value,
+            'n_computed': np.arange(n + 1),
+            'y_prefix': self._y_full[:n + 1],
+        }
+
+    def _apply_step_arrays(self, n, arrays):
+        """Push precomputed step arrays onto the animated artists"""
+        self.h_markers.set_data(arrays['h_k'], arrays['h_values'])
+        self.h_stems.set_segments(
+            self._stem_segments(arrays['h_k'], arrays['h_values']))
+        self.title_h.set_text(f'h[{n}-k] (Flipped & Shifted)')
+
+        self.product_markers.set_data(arrays['kk'], arrays['product'])
+        self.product_stems.set_segments(
+            self._stem_segments(arrays['kk'], arrays['product']))
+        self.title_product.set_text(
+            f'x[k] × h[{n}-k] → Sum = {arrays["sum"]:.3f}')
+
+        self.output_markers.set_data(arrays['n_computed'], arrays['y_prefix'])
+        self.output_stems.set_segments(
+            self._stem_segments(arrays['n_computed'], arrays['y_prefix']))
+        self.output_highlight.set_data([n], [arrays['y_prefix'][n]])
+        self.output_highlight_stem.set_segments(
+            self._stem_segments([n], [arrays['y_prefix'][n]]))
+        pending_lo = n + 0.5
+        pending_hi = self.output_length - 0.5
+        self.output_pending.set_xy([[pending_lo, 0], [pending_lo, 1],
+                                    [pending_hi, 1], [pending_hi, 0]])
+        self.output_pending.set_visible(n + 1 < self.output_length)
+        self.title_output.set_text(
+            f'Convolution Output y[n] | Step {n + 1}/{self.output_length}')
+        return self._animated_artists
+
+    def update_plots(self):
+        """Update all plots for current step.
+
+        The axes are never cleared: all per-step changes go through the
+        persistent animated artists (data, segments, title text), and the
+        static layer — spines, grids, labels, tick locators, axis limits —
+        is built exactly once in setup_plots.
+        """
+        # Nothing to do when the step hasn't moved (e.g. reset while
+        # already at the first step)
+        if self.current_n == self._last_drawn_n and not self._force_redraw:
+            return
+        self._force_redraw = False
+
+        # Current step
+        n = self.current_n
+        arrays = self._compute_step(n)
+        self._apply_step_arrays(n, arrays)
+        sum_value = arrays['sum']
+
+        # Update equation, step info, progress and status in one batch,
+        # touching only the widgets whose displayed value actually changed
         progress_percent = int((n / max(1, self.output_length - 1)) * 100)
-        self.progress['value'] = n
-        self.progress_label.config(text=f"{progress_percent}%")
-        
-        # Update status
-        self.status_var.set(f"Computing y[{n}] = {sum_value:.3f}")
-        
-        self.canvas.draw()
-        
+        text_state = (n, sum_value, progress_percent)
+        if text_state != self._last_text_state:
+            last = self._last_text_state
+            if last is None or (n, sum_value) != last[:2]:
+                self.math_var.set(self._MATH_FMT % (n, n, sum_value))
+                self.step_label.config(
+                    text=self._STEP_FMT % (n + 1, self.output_length, n))
+                self.status_var.set(self._STATUS_FMT % (n, sum_value))
+                self.progress['value'] = n
+            if last is None or progress_percent != last[2]:
+                self.progress_label.config(text="%d%%" % progress_percent)
+            self._last_text_state = text_state
+
+        self._draw_frame()
+        self._last_drawn_n = n
+
     def next_step(self):
         """Go to next step"""
         if self.current_n < self.output_length - 1:
@@ -464,6 +656,9 @@ class StepByStepConvolutionViewer:
         self.is_playing = True
         self.play_button.config(text="⏸️ Pause")
         self.animation_indicator.config(text="▶️")
+        # Deadline of the frame drawn immediately below on the monotonic
+        # clock; _animate_step advances it by one period when scheduling
+        self._next_t = time.perf_counter()
         self._animate_step()
         
     def _animate_step(self):
@@ -474,8 +669,20 @@ class StepByStepConvolutionViewer:
             if self.current_n >= self.output_length - 1:
                 self.stop_animation()
             else:
-                # Schedule next step based on speed
-                delay = int(1000 / self.speed_var.get())  # Convert to milliseconds
+                # Schedule against a monotonic-clock deadline so callback
+                # latency and draw time don't accumulate as drift; cancel
+                # any pending schedule first so scrubbing cannot pile up
+                # callbacks
+                period = 1 / self.speed_var.get()
+                now = time.perf_counter()
+                self._next_t += period
+                if self._next_t < now:
+                    # Fell badly behind (e.g. a long stall); resynchronize
+                    # instead of firing a burst of catch-up frames
+                    self._next_t = now + period
+                delay = max(1, int((self._next_t - now) * 1000))
+                if self.animation is not None:
+                    self.root.after_cancel(self.animation)
                 self.animation = self.root.after(delay, self._animate_step)
         
     def stop_animation(self):
@@ -488,9 +695,14 @@ class StepByStepConvolutionViewer:
             self.animation = None
         
     def update_speed_label(self, event=None):
-        """Update speed label"""
-        speed = self.speed_var.get()
-        self.speed_label.config(text=f"{speed:.1f}x")
+        """Update speed label, debounced: <Motion> fires per pixel of drag"""
+        if self._speed_after is not None:
+            self.root.after_cancel(self._speed_after)
+        self._speed_after = self.root.after(50, self._set_speed_label)
+
+    def _set_speed_label(self):
+        self._speed_after = None
+        self.speed_label.config(text=f"{self.speed_var.get():.1f}x")
     
     def open_main_viewer(self):
         """Open main convolution viewer"""
@@ -510,27 +722,41 @@ class StepByStepConvolutionViewer:
         """Export animation frames"""
         try:
             from matplotlib.animation import FuncAnimation, PillowWriter
-            
+
+            # Tabulate every step once; each exported frame then only
+            # pushes cached arrays onto the animated artists
+            step_cache = [self._compute_step(i)
+                          for i in range(self.output_length)]
+
             def animate(frame):
-                old_n = self.current_n
-                self.current_n = frame
-                self.update_plots()
-                self.current_n = old_n
-                return []
-            
-            anim = FuncAnimation(self.fig, animate, frames=self.output_length, 
-                               interval=1000, blit=False, repeat=False)
-            
+                return self._apply_step_arrays(frame, step_cache[frame])
+
+            anim = FuncAnimation(self.fig, animate, frames=self.output_length,
+                               interval=1000, blit=True, repeat=False)
+
             filename = filedialog.asksaveasfilename(
                 defaultextension=".gif",
                 filetypes=[("GIF files", "*.gif"), ("All files", "*.*")],
                 title="Export Animation"
             )
-            
+
             if filename:
-                anim.save(filename, writer=PillowWriter(fps=1))
+                # The export writer re-renders through the full-draw path,
+                # which skips animated artists; un-animate them for the save
+                self._exporting = True
+                for artist in self._animated_artists:
+                    artist.set_animated(False)
+                try:
+                    anim.save(filename, writer=PillowWriter(fps=1))
+                finally:
+                    for artist in self._animated_artists:
+                        artist.set_animated(True)
+                    self._exporting = False
+                    self._background = None
+                    self._force_redraw = True
+                    self.update_plots()
                 messagebox.showinfo("Success", f"Animation exported to {filename}")
-                
+
         except Exception as e:
             messagebox.showerror("Error", f"Could not export animation: {str(e)}")
 
@@ -1,16 +1,53 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import subprocess
-import sys
-import os
 import json
 import matplotlib
 matplotlib.use('TkAgg')
 
+# Global matplotlib configuration, applied once at import time instead of
+# per viewer window (rcParams.update re-validates every key it is given)
+plt.style.use('default')
+plt.rcParams.update({
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '#2563eb',
+    'axes.labelcolor': '#1e293b',
+    'xtick.color': '#64748b',
+    'ytick.color': '#64748b',
+    'grid.color': '#e2e8f0',
+    'text.color': '#1e293b',
+    'font.size': 10
+})
+
+try:
+    from scipy.signal import oaconvolve
+except ImportError:  # scipy is optional; fall back to direct convolution
+    oaconvolve = None
+
+try:
+    # Imported at startup so the first click on "Step-by-Step View" does
+    # not pay the viewer's import cost
+    from convolution_step_by_step_viewer import StepByStepConvolutionViewer
+except ImportError:
+    StepByStepConvolutionViewer = None
+
+# Below this combined length np.convolve's direct C loop wins; above it
+# the FFT overlap-add method takes over
+_FFT_CONV_THRESHOLD = 64
+
+
+def _full_convolve(x, h):
+    """Full convolution of x and h, FFT-based when the signals are long"""
+    if oaconvolve is not None and len(x) + len(h) > _FFT_CONV_THRESHOLD:
+        return oaconvolve(x, h, mode='full')
+    return np.convolve(x, h, mode='full')
+
+
 class ConvolutionViewer:
     def __init__(self, root):
         self.root = root
@@ -24,6 +61,8 @@ class ConvolutionViewer:
         
         # Initialize signals with dynamic n_points
         self.n_points = 7  # Initial value set to 7
+        # Sample indices for the current length, shared by the presets
+        self._n_cache = np.arange(self.n_points, dtype=np.float64)
         self.x_signal = np.array([1, 2, 1, 0, 0, 0, 0])
         self.h_signal = np.array([0.5, 0.3, 0.2, 0, 0, 0, 0])
         self.y_signal = np.convolve(self.x_signal, self.h_signal, mode='full')
@@ -32,7 +71,44 @@ class ConvolutionViewer:
         self.status_var = tk.StringVar(value="Ready - Select a signal to edit")
         self.current_signal = 'x'
         self.dragging = False
-        
+
+        # Blitting state: static background captured after a full draw,
+        # invalidated whenever limits, titles or grids change
+        self._background = None
+        self._axes_state = None
+
+        # Drag editing coalesces motion events into one scheduled redraw
+        self._pending_redraw = False
+        self._length_after = None
+
+        # Sample-index arrays for the three panels, rebuilt only when the
+        # corresponding length changes
+        self._n_x = None
+        self._n_h = None
+        self._n_y = None
+
+        # Signal version counters: update_plots recomputes the convolution
+        # only when one of them has moved since the last compute
+        self._x_ver = 0
+        self._h_ver = 0
+        self._y_key = None
+
+        # Optional Numba kernels for the short-signal convolutions and the
+        # fused signal statistics that dominate drag editing; warm the JIT
+        # so the first edit doesn't pay the compile time
+        self._y_buf = None
+        self._stats_cache = {}
+        try:
+            from _kernels import conv_full, signal_stats
+            self._conv_full = conv_full
+            self._signal_stats = signal_stats
+            warm = np.zeros(1)
+            self._conv_full(warm, warm, np.zeros(1))
+            self._signal_stats(warm)
+        except ImportError:
+            self._conv_full = None
+            self._signal_stats = None
+
         self.setup_ui()
         self.setup_plots()
         self.update_plots()
@@ -205,12 +281,13 @@ class ConvolutionViewer:
         ttk.Label(length_frame, text="Signal Length:", style='Info.TLabel').pack(side=tk.LEFT)
         
         self.length_var = tk.IntVar(value=self.n_points)
-        length_spinbox = tk.Spinbox(length_frame, from_=3, to=50, textvariable=self.length_var, 
-                                   width=6, command=self.on_length_change, font=('Segoe UI', 9))
-        length_spinbox.pack(side=tk.RIGHT)
-        length_spinbox.bind('<KeyRelease>', lambda e: self.on_length_change())
-        length_spinbox.bind('<ButtonRelease>', lambda e: self.on_length_change())
+        length_spinbox = tk.Spinbox(length_frame, from_=3, to=50, textvariable=self.length_var,
+                                   width=6, command=self._schedule_length_change, font=('Segoe UI', 9))
         length_spinbox.pack(side=tk.RIGHT)
+        # All three triggers (command, key, button) can fire for one user
+        # gesture; funnel them through a single coalesced handler
+        length_spinbox.bind('<KeyRelease>', self._schedule_length_change)
+        length_spinbox.bind('<ButtonRelease>', self._schedule_length_change)
         
         # Operations
         ops_frame = ttk.LabelFrame(control_frame, text="Operations", padding=10)
@@ -253,6 +330,18 @@ class ConvolutionViewer:
         
         self.properties_frame = ttk.Frame(props_frame)
         self.properties_frame.pack(fill=tk.X, pady=(5, 0))
+
+        # Fixed label pairs, created once and updated in place: Tk widget
+        # construction is far too slow to repeat on every drag sample
+        self._prop_labels = {}
+        for row, prop in enumerate(("Length", "Energy", "Max", "Min",
+                                    "Mean", "Non-zero")):
+            ttk.Label(self.properties_frame, text=f"{prop}:",
+                     style='Info.TLabel').grid(row=row, column=0, sticky='w', padx=(0, 10))
+            value_label = ttk.Label(self.properties_frame, text="",
+                                    font=('Consolas', 9, 'bold'))
+            value_label.grid(row=row, column=1, sticky='w')
+            self._prop_labels[prop] = value_label
         
     def create_plot_area(self, parent):
         """Create plot area"""
@@ -267,31 +356,17 @@ class ConvolutionViewer:
         
         self.grid_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(controls_frame, text="Grid", variable=self.grid_var,
-                       command=self.update_plots).pack(side=tk.LEFT, padx=10)
-        
+                       command=self._toggle_grid).pack(side=tk.LEFT, padx=10)
+
         self.stem_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(controls_frame, text="Stem Plot", variable=self.stem_var,
-                       command=self.update_plots).pack(side=tk.LEFT, padx=5)
+                       command=self._toggle_stem).pack(side=tk.LEFT, padx=5)
         
         # Refresh button
         ttk.Button(controls_frame, text="🔄 Refresh", 
                   command=self.update_plots,
                   style='Secondary.TButton').pack(side=tk.RIGHT)
         
-        # Configure matplotlib for clean appearance
-        plt.style.use('default')
-        plt.rcParams.update({
-            'figure.facecolor': 'white',
-            'axes.facecolor': 'white',
-            'axes.edgecolor': '#2563eb',
-            'axes.labelcolor': '#1e293b',
-            'xtick.color': '#64748b',
-            'ytick.color': '#64748b',
-            'grid.color': '#e2e8f0',
-            'text.color': '#1e293b',
-            'font.size': 10
-        })
-        
         # Create figure with appropriate size for the layout
         self.fig = Figure(figsize=(11, 8), dpi=100, facecolor='white')
         
@@ -353,155 +428,323 @@ class ConvolutionViewer:
             ax.spines['left'].set_color('#2563eb')
             ax.spines['bottom'].set_color('#2563eb')
             ax.tick_params(colors='#64748b', labelsize=9)
-        
-    def update_plots(self):
-        """Update all plots"""
-        # Clear plots
-        self.ax1.clear()
-        self.ax2.clear()
-        self.ax3.clear()
-        
+
         # Color scheme
         colors = {
             'x_signal': '#3b82f6',
             'h_signal': '#1e40af',
             'y_signal': '#1e293b'
         }
-        
-        # Calculate convolution
-        self.y_signal = np.convolve(self.x_signal, self.h_signal, mode='full')
-        
-        # Plot x[n]
-        n_x = np.arange(len(self.x_signal))
-        if self.stem_var.get():
-            self.ax1.stem(n_x, self.x_signal, basefmt=' ', 
-                         linefmt=colors['x_signal'], markerfmt='o' )
-        else:
-            self.ax1.plot(n_x, self.x_signal, color=colors['x_signal'], marker='o' )
-        
-        self.ax1.set_title('Input Signal x[n]', fontsize=12, fontweight='bold', color='#2563eb')
+
+        # Static titles and labels
+        self.ax1.set_title('Input Signal x[n]', fontsize=12, fontweight='bold',
+                           color='#2563eb')
         self.ax1.set_ylabel('Amplitude', fontsize=10)
-        
-        if self.grid_var.get():
-            self.ax1.grid(True, linestyle='--', color='#e2e8f0')
-        
-        self.ax1.set_ylim([-2, max(3, np.max(np.abs(self.x_signal)) + 1)])
-        
-        # Add editing hint for active signal
-        if self.current_signal == 'x':
-            self.ax1.text(0.02, 0.95, '✏️ Click and drag to edit', 
-                         transform=self.ax1.transAxes, fontsize=9,
-                         bbox=dict(boxstyle="round,pad=0.3", facecolor='#dbeafe'))
-        
-        # Plot h[n]
-        n_h = np.arange(len(self.h_signal))
-        if self.stem_var.get():
-            self.ax2.stem(n_h, self.h_signal, basefmt=' ', 
-                         linefmt=colors['h_signal'], markerfmt='s' )
-        else:
-            self.ax2.plot(n_h, self.h_signal, color=colors['h_signal'], marker='s' )
-        
-        self.ax2.set_title('Impulse Response h[n]', fontsize=12, fontweight='bold', color='#2563eb')
+        self.ax2.set_title('Impulse Response h[n]', fontsize=12,
+                           fontweight='bold', color='#2563eb')
         self.ax2.set_ylabel('Amplitude', fontsize=10)
-        
-        if self.grid_var.get():
-            self.ax2.grid(True, linestyle='--', color='#e2e8f0')
-        
-        self.ax2.set_ylim([-2, max(3, np.max(np.abs(self.h_signal)) + 1)])
-        
-        if self.current_signal == 'h':
-            self.ax2.text(0.02, 0.95, '✏️ Click and drag to edit', 
-                         transform=self.ax2.transAxes, fontsize=9,
-                         bbox=dict(boxstyle="round,pad=0.3", facecolor='#dbeafe'))
-        
-        # Plot y[n]
-        n_y = np.arange(len(self.y_signal))
-        if self.stem_var.get():
-            self.ax3.stem(n_y, self.y_signal, basefmt=' ', 
-                         linefmt=colors['y_signal'], markerfmt='D' )
-        else:
-            self.ax3.plot(n_y, self.y_signal, color=colors['y_signal'], marker='D' )
-        
-        conv_length = len(self.y_signal)
-        self.ax3.set_title(f'Convolution Output y[n] = x[n] ∗ h[n] (Length: {conv_length})', 
-                          fontsize=12, fontweight='bold', color='#1e293b')
         self.ax3.set_xlabel('Sample Index (n)', fontsize=10)
         self.ax3.set_ylabel('Amplitude', fontsize=10)
-        
-        if self.grid_var.get():
-            self.ax3.grid(True, linestyle='--', color='#e2e8f0')
-        
-        if len(self.y_signal) > 0:
-            self.ax3.set_ylim([min(-1, np.min(self.y_signal) - 0.5), 
-                              max(3, np.max(self.y_signal) + 0.5)])
-        
+
+        # Persistent artists: one stem LineCollection + marker-head Line2D
+        # pair and one connected line per axis, toggled by display mode and
+        # updated in place on every redraw
+        self.stem_x, self.head_x, self.line_x = self._add_signal_artists(
+            self.ax1, colors['x_signal'], 'o')
+        self.stem_h, self.head_h, self.line_h = self._add_signal_artists(
+            self.ax2, colors['h_signal'], 's')
+        self.stem_y, self.head_y, self.line_y = self._add_signal_artists(
+            self.ax3, colors['y_signal'], 'D')
+
+        # Editing hints for the active signal, toggled by visibility
+        self.hint_x = self.ax1.text(0.02, 0.95, '✏️ Click and drag to edit',
+                                    transform=self.ax1.transAxes, fontsize=9,
+                                    bbox=dict(boxstyle="round,pad=0.3",
+                                              facecolor='#dbeafe'),
+                                    animated=True)
+        self.hint_h = self.ax2.text(0.02, 0.95, '✏️ Click and drag to edit',
+                                    transform=self.ax2.transAxes, fontsize=9,
+                                    bbox=dict(boxstyle="round,pad=0.3",
+                                              facecolor='#dbeafe'),
+                                    animated=True)
+
+        self._animated_artists = [
+            self.stem_x, self.head_x, self.line_x,
+            self.stem_h, self.head_h, self.line_h,
+            self.stem_y, self.head_y, self.line_y,
+            self.hint_x, self.hint_h,
+        ]
+
+        self._background = None
+        self._axes_state = None
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @staticmethod
+    def _add_signal_artists(ax, color, marker):
+        """Create the reusable stem, marker-head and line artists on ax"""
+        stems = LineCollection([], colors=color, animated=True)
+        ax.add_collection(stems)
+        heads, = ax.plot([], [], marker, color=color, animated=True)
+        line, = ax.plot([], [], color=color, marker=marker, animated=True)
+        return stems, heads, line
+
+    @staticmethod
+    def _stem_segments(n, values):
+        """Vertical stem segments from the baseline to each sample.
+
+        Returns an (N, 2, 2) array so LineCollection.set_segments gets one
+        batch assignment instead of a per-segment Python list.
+        """
+        n = np.asarray(n, dtype=float)
+        values = np.asarray(values, dtype=float)
+        return np.stack([np.column_stack([n, np.zeros_like(values)]),
+                         np.column_stack([n, values])], axis=1)
+
+    @staticmethod
+    def _set_signal_artists(stems, heads, line, n, signal, stem_mode):
+        """Push signal data onto one axis' artists for the display mode"""
+        if stem_mode:
+            stems.set_segments(ConvolutionViewer._stem_segments(n, signal))
+            heads.set_data(n, signal)
+        else:
+            line.set_data(n, signal)
+        stems.set_visible(stem_mode)
+        heads.set_visible(stem_mode)
+        line.set_visible(not stem_mode)
+
+    def _on_resize(self, event):
+        """Invalidate the cached background when the canvas is resized"""
+        self._background = None
+
+    def _on_draw(self, event):
+        """Recapture the static layer after any full draw.
+
+        Full draws skip animated artists, and the backend triggers them on
+        its own (initial window mapping, Tk resizes), so paint the artists
+        back on top of the fresh background here.
+        """
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists:
+            self.fig.draw_artist(artist)
+
+    def _toggle_grid(self):
+        """Restyle the grids; no convolution or artist-data work needed"""
+        grid_on = self.grid_var.get()
+        for ax in (self.ax1, self.ax2, self.ax3):
+            ax.grid(grid_on, linestyle='--', color='#e2e8f0')
+        # Keep the tracked state in sync so the next update_plots doesn't
+        # see a spurious change; the grid lives in the blitted background,
+        # which must be re-rendered
+        if self._axes_state is not None:
+            self._axes_state = self._axes_state[:-1] + (grid_on,)
+        self._draw_frame(needs_full=True)
+
+    def _toggle_stem(self):
+        """Swap stem/line artist visibility without recomputing anything"""
+        if self._n_x is None:
+            self.update_plots()
+            return
+        stem_mode = self.stem_var.get()
+        self._set_signal_artists(self.stem_x, self.head_x, self.line_x,
+                                 self._n_x, self.x_signal, stem_mode)
+        self._set_signal_artists(self.stem_h, self.head_h, self.line_h,
+                                 self._n_h, self.h_signal, stem_mode)
+        self._set_signal_artists(self.stem_y, self.head_y, self.line_y,
+                                 self._n_y, self.y_signal, stem_mode)
+        self._draw_frame(needs_full=False)
+
+    def _get_stats(self, which):
+        """Cached (min, max, sum, energy, nonzero) of signal 'x', 'h' or 'y'.
+
+        Computed in one pass per signal version and shared by the axis
+        limits and the properties panel, instead of five separate NumPy
+        reductions in each consumer.
+        """
+        if which == 'x':
+            signal, version = self.x_signal, self._x_ver
+        elif which == 'h':
+            signal, version = self.h_signal, self._h_ver
+        else:
+            signal, version = self.y_signal, self._y_key
+        cached = self._stats_cache.get(which)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        if self._signal_stats is not None:
+            stats = self._signal_stats(signal)
+        else:
+            stats = (float(np.min(signal)), float(np.max(signal)),
+                     float(np.sum(signal)), float(signal @ signal),
+                     int(np.count_nonzero(signal)))
+        self._stats_cache[which] = (version, stats)
+        return stats
+
+    def _apply_axes_state(self):
+        """Apply data-dependent limits, title and grids; True when changed.
+
+        A change means the static layer is stale and the next draw must be
+        a full one; otherwise the cached background is still valid and the
+        artists can simply be blitted over it.
+        """
+        conv_length = len(self.y_signal)
+        grid_on = self.grid_var.get()
+        x_min, x_max = self._get_stats('x')[:2]
+        h_min, h_max = self._get_stats('h')[:2]
+        y_min, y_max = self._get_stats('y')[:2]
+        state = (
+            (-0.5, len(self.x_signal) - 0.5),
+            (-2, max(3, max(abs(x_min), abs(x_max)) + 1)),
+            (-0.5, len(self.h_signal) - 0.5),
+            (-2, max(3, max(abs(h_min), abs(h_max)) + 1)),
+            (-0.5, conv_length - 0.5),
+            (min(-1, y_min - 0.5), max(3, y_max + 0.5)),
+            conv_length,
+            grid_on,
+        )
+        if state == self._axes_state:
+            return False
+        self._axes_state = state
+
+        self.ax1.set_xlim(state[0])
+        self.ax1.set_ylim(state[1])
+        self.ax2.set_xlim(state[2])
+        self.ax2.set_ylim(state[3])
+        self.ax3.set_xlim(state[4])
+        self.ax3.set_ylim(state[5])
+        self.ax3.set_title(
+            f'Convolution Output y[n] = x[n] ∗ h[n] (Length: {conv_length})',
+            fontsize=12, fontweight='bold', color='#1e293b')
+        for ax in (self.ax1, self.ax2, self.ax3):
+            ax.grid(grid_on, linestyle='--', color='#e2e8f0')
+        return True
+
+    def _draw_frame(self, needs_full):
+        """Blit the artists, re-rendering the static layer only if stale"""
+        if needs_full or self._background is None:
+            # The full draw fires draw_event, so _on_draw recaptures the
+            # background and paints the artists before the backend blits
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self._animated_artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+    def update_plots(self):
+        """Update all plots"""
+        # Calculate convolution, skipped entirely for cosmetic redraws
+        if (self._x_ver, self._h_ver) != self._y_key:
+            out_size = len(self.x_signal) + len(self.h_signal) - 1
+            if (self._conv_full is not None
+                    and out_size <= _FFT_CONV_THRESHOLD):
+                # Numba direct kernel into a reused buffer: no allocation
+                # and no NumPy dispatch on the per-drag hot path
+                if self._y_buf is None or self._y_buf.size != out_size:
+                    self._y_buf = np.empty(out_size)
+                self._conv_full(self.x_signal, self.h_signal, self._y_buf)
+                self.y_signal = self._y_buf
+            else:
+                self.y_signal = _full_convolve(self.x_signal, self.h_signal)
+            self._y_key = (self._x_ver, self._h_ver)
+
+        stem_mode = self.stem_var.get()
+
+        # Refresh the cached index arrays only when a length changed
+        if self._n_x is None or self._n_x.size != len(self.x_signal):
+            self._n_x = np.arange(len(self.x_signal))
+        if self._n_h is None or self._n_h.size != len(self.h_signal):
+            self._n_h = np.arange(len(self.h_signal))
+        if self._n_y is None or self._n_y.size != len(self.y_signal):
+            self._n_y = np.arange(len(self.y_signal))
+
+        # Plot x[n]
+        self._set_signal_artists(self.stem_x, self.head_x, self.line_x,
+                                 self._n_x, self.x_signal, stem_mode)
+
+        # Plot h[n]
+        self._set_signal_artists(self.stem_h, self.head_h, self.line_h,
+                                 self._n_h, self.h_signal, stem_mode)
+
+        # Plot y[n]
+        self._set_signal_artists(self.stem_y, self.head_y, self.line_y,
+                                 self._n_y, self.y_signal, stem_mode)
+
+        # Editing hint for the active signal
+        self.hint_x.set_visible(self.current_signal == 'x')
+        self.hint_h.set_visible(self.current_signal == 'h')
+
+        needs_full = self._apply_axes_state()
+
         # Update properties and status
+        conv_length = len(self.y_signal)
         self.update_signal_properties()
         self.status_var.set(f"Convolution computed: {len(self.x_signal)} + {len(self.h_signal)} - 1 = {conv_length} samples")
         self.info_label.config(text=f"Output Length: {conv_length}")
-        
-        self.canvas.draw()
-        
+
+        self._draw_frame(needs_full)
+
     def update_signal_properties(self):
         """Update signal properties display"""
-        # Clear existing properties
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
-        
         # Get current signal
         if self.signal_var.get().startswith("x[n]"):
-            signal = self.x_signal
+            which, signal = 'x', self.x_signal
         else:
-            signal = self.h_signal
-        
-        # Calculate properties with dynamic length info
-        properties = {
-            "Length": f"{len(signal)} / {self.n_points}",
-            "Energy": f"{np.sum(signal**2):.3f}",
-            "Max": f"{np.max(signal):.3f}",
-            "Min": f"{np.min(signal):.3f}",
-            "Mean": f"{np.mean(signal):.3f}",
-            "Non-zero": f"{np.count_nonzero(signal)}"
-        }
-        
-        # Display properties in grid
-        row = 0
-        for prop, value in properties.items():
-            ttk.Label(self.properties_frame, text=f"{prop}:", 
-                     style='Info.TLabel').grid(row=row, column=0, sticky='w', padx=(0, 10))
-            ttk.Label(self.properties_frame, text=value, 
-                     font=('Consolas', 9, 'bold')).grid(row=row, column=1, sticky='w')
-            row += 1
+            which, signal = 'h', self.h_signal
+
+        # Update the persistent value labels from the fused stats pass
+        smin, smax, total, energy, nonzero = self._get_stats(which)
+        labels = self._prop_labels
+        labels["Length"].config(text=f"{len(signal)} / {self.n_points}")
+        labels["Energy"].config(text=f"{energy:.3f}")
+        labels["Max"].config(text=f"{smax:.3f}")
+        labels["Min"].config(text=f"{smin:.3f}")
+        labels["Mean"].config(text=f"{total / len(signal):.3f}")
+        labels["Non-zero"].config(text=f"{nonzero}")
     
     def set_preset(self, preset_type):
         """Set preset signal patterns"""
-        n = np.arange(self.n_points)
-        
+        # One output allocation; every branch fills it in place through
+        # out= ufuncs against the cached sample-index array
+        n = self._n_cache
+        signal = np.empty_like(n)
+
         if preset_type == "impulse":
-            signal = np.zeros(self.n_points)
+            signal.fill(0.0)
             signal[0] = 1.0
         elif preset_type == "step":
-            signal = np.ones(self.n_points)
+            signal.fill(1.0)
         elif preset_type == "exponential":
-            signal = 0.8 ** n
+            np.power(0.8, n, out=signal)
         elif preset_type == "sine":
-            signal = np.sin(2 * np.pi * n / 8)
+            np.multiply(n, 2 * np.pi / 8, out=signal)
+            np.sin(signal, out=signal)
         elif preset_type == "triangular":
-            signal = np.maximum(0, 1 - np.abs(n - self.n_points//4) / (self.n_points//8))
+            np.subtract(n, self.n_points // 4, out=signal)
+            np.abs(signal, out=signal)
+            signal /= self.n_points // 8
+            np.subtract(1.0, signal, out=signal)
+            np.maximum(signal, 0.0, out=signal)
         elif preset_type == "gaussian":
-            signal = np.exp(-0.5 * ((n - self.n_points//2) / (self.n_points//8))**2)
+            np.subtract(n, self.n_points // 2, out=signal)
+            signal /= self.n_points // 8
+            np.square(signal, out=signal)
+            signal *= -0.5
+            np.exp(signal, out=signal)
         elif preset_type == "random":
-            signal = np.random.uniform(-1, 1, self.n_points)
+            signal[:] = np.random.uniform(-1, 1, self.n_points)
         elif preset_type == "clear":
-            signal = np.zeros(self.n_points)
+            signal.fill(0.0)
         else:
             return
-            
+
         if self.current_signal == 'x':
-            self.x_signal = signal.copy()
+            self.x_signal = signal
+            self._x_ver += 1
             self.status_var.set(f"Applied {preset_type} preset to x[n]")
         else:
-            self.h_signal = signal.copy()
+            self.h_signal = signal
+            self._h_ver += 1
             self.status_var.set(f"Applied {preset_type} preset to h[n]")
             
         self.input_var.set(','.join(f'{x:.3f}' for x in signal))
@@ -510,12 +753,15 @@ class ConvolutionViewer:
     def swap_signals(self):
         """Swap x[n] and h[n] signals"""
         self.x_signal, self.h_signal = self.h_signal.copy(), self.x_signal.copy()
+        self._x_ver += 1
+        self._h_ver += 1
         self.on_signal_change()
         self.update_plots()
     
     def reverse_h_signal(self):
         """Reverse h[n] signal"""
         self.h_signal = np.flip(self.h_signal)
+        self._h_ver += 1
         if self.current_signal == 'h':
             self.input_var.set(','.join(f'{x:.3f}' for x in self.h_signal))
         self.update_plots()
@@ -524,8 +770,10 @@ class ConvolutionViewer:
         """Normalize both signals to [-1, 1]"""
         if np.max(np.abs(self.x_signal)) > 0:
             self.x_signal = self.x_signal / np.max(np.abs(self.x_signal))
+            self._x_ver += 1
         if np.max(np.abs(self.h_signal)) > 0:
             self.h_signal = self.h_signal / np.max(np.abs(self.h_signal))
+            self._h_ver += 1
         self.on_signal_change()
         self.update_plots()
     
@@ -544,41 +792,47 @@ class ConvolutionViewer:
             messagebox.showerror("Error", f"Could not export plot: {str(e)}")
     
     def save_signals(self):
-        """Save current signals to JSON file"""
+        """Save current signals to a NumPy .npz session file"""
         try:
             filename = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                defaultextension=".npz",
+                filetypes=[("NumPy archives", "*.npz"), ("All files", "*.*")],
                 title="Save Signals"
             )
             if filename:
-                data = {
-                    'x_signal': self.x_signal.tolist(),
-                    'h_signal': self.h_signal.tolist(),
-                    'length': self.n_points
-                }
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Binary float64 dump; no per-sample Python float objects
+                np.savez(filename, x_signal=self.x_signal,
+                         h_signal=self.h_signal, length=self.n_points)
                 messagebox.showinfo("Success", f"Session saved to {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not save file: {str(e)}")
-            
+
     def load_signals(self):
-        """Load signals from JSON file"""
+        """Load signals from a session file (.npz, or legacy .json)"""
         try:
             filename = filedialog.askopenfilename(
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=[("NumPy archives", "*.npz"),
+                           ("JSON files", "*.json"), ("All files", "*.*")],
                 title="Load Signals"
             )
             if filename:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                
-                self.x_signal = np.array(data['x_signal'])
-                self.h_signal = np.array(data['h_signal'])
-                self.n_points = data.get('length', len(self.x_signal))
+                if filename.endswith('.json'):
+                    # Sessions saved before the switch to .npz
+                    with open(filename, 'r') as f:
+                        data = json.load(f)
+                    self.x_signal = np.array(data['x_signal'])
+                    self.h_signal = np.array(data['h_signal'])
+                    self.n_points = data.get('length', len(self.x_signal))
+                else:
+                    with np.load(filename) as data:
+                        self.x_signal = data['x_signal']
+                        self.h_signal = data['h_signal']
+                        self.n_points = int(data['length'])
+                self._x_ver += 1
+                self._h_ver += 1
+                self._n_cache = np.arange(self.n_points, dtype=np.float64)
                 self.length_var.set(self.n_points)
-                
+
                 self.on_signal_change()
                 self.update_plots()
                 messagebox.showinfo("Success", f"Session loaded from {filename}")
@@ -598,26 +852,42 @@ class ConvolutionViewer:
             
     def on_manual_input(self, event=None):
         """Handle manual signal input"""
+        text = self.input_var.get().strip().strip(',')
+        if not text:
+            return
+
+        # Parse straight into an array with no intermediate Python list of
+        # floats; any unparseable token raises and hits the error dialog
         try:
-            values = [float(x.strip()) for x in self.input_var.get().split(',') if x.strip()]
-            if not values:
-                return
-                
-            # Pad or truncate to current length
-            while len(values) < self.n_points:
-                values.append(0.0)
-            values = values[:self.n_points]
-            
-            if self.current_signal == 'x':
-                self.x_signal = np.array(values)
-            else:
-                self.h_signal = np.array(values)
-                
-            self.update_plots()
-            
+            parsed = np.fromiter((float(t) for t in text.split(',')),
+                                 dtype=np.float64)
         except ValueError:
             messagebox.showerror("Input Error", "Invalid input. Please enter comma-separated numbers.")
+            return
+
+        values = np.zeros(self.n_points)
+        k = min(parsed.size, self.n_points)
+        values[:k] = parsed[:k]
+
+        if self.current_signal == 'x':
+            self.x_signal = values
+            self._x_ver += 1
+        else:
+            self.h_signal = values
+            self._h_ver += 1
+
+        self.update_plots()
             
+    def _schedule_length_change(self, event=None):
+        """Coalesce the Spinbox's command/key/button events per gesture"""
+        if self._length_after is not None:
+            self.root.after_cancel(self._length_after)
+        self._length_after = self.root.after(50, self._do_length_change)
+
+    def _do_length_change(self):
+        self._length_after = None
+        self.on_length_change()
+
     def on_length_change(self):
         """Handle signal length change with real-time updates"""
         try:
@@ -627,26 +897,26 @@ class ConvolutionViewer:
                 new_length = 3
                 self.length_var.set(new_length)
             
-            # Store current non-zero values
-            x_nonzero = self.x_signal[self.x_signal != 0] if len(self.x_signal) > 0 else np.array([0])
-            h_nonzero = self.h_signal[self.h_signal != 0] if len(self.h_signal) > 0 else np.array([0])
-            
-            # Resize signals intelligently
-            if new_length > len(self.x_signal):
-                # Pad with zeros
-                self.x_signal = np.pad(self.x_signal, (0, new_length - len(self.x_signal)))
-                self.h_signal = np.pad(self.h_signal, (0, new_length - len(self.h_signal)))
-            else:
-                # Truncate but preserve important values
-                self.x_signal = np.zeros(new_length)
-                self.h_signal = np.zeros(new_length)
-                
-                # Restore non-zero values up to new length
-                self.x_signal[:min(len(x_nonzero), new_length)] = x_nonzero[:min(len(x_nonzero), new_length)]
-                self.h_signal[:min(len(h_nonzero), new_length)] = h_nonzero[:min(len(h_nonzero), new_length)]
-            
+            # Resize with one allocation and one slice copy per signal:
+            # zero-pad when growing, truncate in place when shrinking.
+            # (The old shrink path compacted non-zero samples to the left,
+            # silently reordering the signal.)
+            new_x = np.zeros(new_length)
+            keep = min(len(self.x_signal), new_length)
+            new_x[:keep] = self.x_signal[:keep]
+            self.x_signal = new_x
+
+            new_h = np.zeros(new_length)
+            keep = min(len(self.h_signal), new_length)
+            new_h[:keep] = self.h_signal[:keep]
+            self.h_signal = new_h
+
+
             self.n_points = new_length
-            
+            self._n_cache = np.arange(self.n_points, dtype=np.float64)
+            self._x_ver += 1
+            self._h_ver += 1
+
             # Update status bar indicator
             self.length_indicator.config(text=f"Length: {self.n_points}")
             self.status_var.set(f"Signal length updated to {self.n_points}")
@@ -685,28 +955,40 @@ class ConvolutionViewer:
         """Update signal value at mouse position"""
         if event.xdata is None or event.ydata is None:
             return
-            
+
         n = int(round(event.xdata))
         if self.current_signal == 'x' and 0 <= n < len(self.x_signal):
+            # Adjacent pixels often round to the same sample and value;
+            # those events carry no new information
+            if abs(self.x_signal[n] - event.ydata) < 1e-9:
+                return
             self.x_signal[n] = event.ydata
-            self.update_plots()
+            self._x_ver += 1
+            self._schedule_redraw()
         elif self.current_signal == 'h' and 0 <= n < len(self.h_signal):
+            if abs(self.h_signal[n] - event.ydata) < 1e-9:
+                return
             self.h_signal[n] = event.ydata
-            self.update_plots()
+            self._h_ver += 1
+            self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """Coalesce rapid edit events into at most one redraw per ~30 ms"""
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.root.after(33, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._pending_redraw = False
+        self.update_plots()
             
     def open_step_by_step(self):
         """Open step-by-step convolution viewer"""
-        try:
-            # Import and launch the step-by-step viewer
-            from convolution_step_by_step_viewer import StepByStepConvolutionViewer
-            step_window = tk.Toplevel(self.root)
-            StepByStepConvolutionViewer(step_window, self.x_signal, self.h_signal)
-        except ImportError:
-            # Fallback: try to run as separate process
-            try:
-                subprocess.Popen([sys.executable, "convolution_step_by_step_viewer.py"])
-            except:
-                messagebox.showwarning("Warning", "Step-by-step viewer not found. Please ensure convolution_step_by_step_viewer.py exists.")
+        if StepByStepConvolutionViewer is None:
+            messagebox.showwarning("Warning", "Step-by-step viewer not found. Please ensure convolution_step_by_step_viewer.py exists.")
+            return
+        step_window = tk.Toplevel(self.root)
+        StepByStepConvolutionViewer(step_window, self.x_signal, self.h_signal)
 
 def main():
     root = tk.Tk()